@@ -1,19 +1,93 @@
 from __future__ import annotations
 
 import csv
+import io
+import mmap
+import os
 import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from itertools import count, repeat
 from pathlib import Path
-from typing import Sequence
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+_READ_BUFFER_SIZE = 8 << 20
+_WRITE_BUFFER_SIZE = 1 << 20
+_PROFILE_BATCH_SIZE = 4096
+_CLEAR_WIN_SCORE = 0.4
+_NUMBER_RE = re.compile(r"[+-]?(?:\d+(?:\.\d+)?|\d{1,3}(?:,\d{3})+(?:\.\d+)?)")
+
+
+_RowRepairer = Callable[[List[str]], Tuple[List[str], Optional[List[Tuple[int, List[str], float]]]]]
 
 
 class AmbiguousRowError(ValueError):
     """Raised when a row has multiple plausible repairs and no user choice is available."""
 
 
+class _ScoringStats(NamedTuple):
+    """Column profiles flattened into parallel per-column sequences for scoring."""
+
+    mean_lengths: tuple[float, ...]
+    length_weights: tuple[float, ...]
+    length_scales: tuple[float, ...]
+    numeric_columns: tuple[int, ...]
+    text_only_columns: tuple[int, ...]
+    required_columns: tuple[int, ...]
+
+
+class _ColumnProfiles(NamedTuple):
+    """Per-column statistics of well-formed rows, one entry per header column.
+
+    All sequences are empty when the file has no well-formed body rows.
+    """
+
+    mean_length: tuple[float, ...]
+    numeric_ratio: tuple[float, ...]
+    non_empty_ratio: tuple[float, ...]
+
+
+_NO_PROFILES = _ColumnProfiles(mean_length=(), numeric_ratio=(), non_empty_ratio=())
+
+
+class _ProfileCounts(NamedTuple):
+    """Per-column sums over well-formed rows; partial counts from file chunks add up."""
+
+    rows: int
+    totals: list[int]
+    numeric_counts: list[int]
+    non_empty_counts: list[int]
+
+
+class _Ambiguity(NamedTuple):
+    """A row whose repair needs a choice, deferred until the whole file is written.
+
+    `row_index` is the row's position in draft number `draft`, counting from 0.
+    """
+
+    line_number: int
+    raw_line: str
+    candidates: list[tuple[int, list[str], float]]
+    row_index: int
+    draft: int = 0
+
+
+class _RangeRepair(NamedTuple):
+    """Result of repairing one byte range of the input into its own draft file."""
+
+    lines: int
+    pending: list[_Ambiguity]
+
+
 def repair(
     input_file: str | Path,
     output_file: str | Path,
     description_column: str | Sequence[str] = "DESCRIPTION",
+    choices: Sequence[int] | None = None,
+    workers: int | None = 1,
 ) -> None:
     """Repair rows in an unquoted comma-separated file.
 
@@ -23,44 +97,234 @@ def repair(
     joins the remaining middle columns back into that text column.
 
     If multiple text columns are provided and a row is ambiguous, the function
-    asks the user to choose the correct repair for that row.
+    asks the user to choose the correct repair for that row. All ambiguous rows
+    are collected while a draft of the output is written next to
+    `output_file`, and prompted for together before the output file itself is
+    created. Pass `choices` to answer them non-interactively: exactly one
+    1-based selection per ambiguous row, in file order.
+
+    Column profiling and row repair are split across `workers` processes over
+    line-aligned ranges of the input when it is greater than one; pass `None`
+    to use every available CPU.
     """
     src = Path(input_file)
     dst = Path(output_file)
 
-    with src.open("r", encoding="utf-8", newline="") as in_fh:
-        lines = [line.rstrip("\r\n") for line in in_fh]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    with _open_lines(src) as lines:
+        header_line = next(lines, None)
+        if header_line is None:
+            dst.write_text("", encoding="utf-8", newline="")
+            return
+
+        header_parts = _split_line(header_line)
+        expected_columns = len(header_parts)
+        text_columns = frozenset(_indices_of(header_parts, description_column))
+
+    profiles = _NO_PROFILES
+    has_overflow = _has_overflow_rows(src, expected_columns)
+    if has_overflow:
+        profiles = _file_column_profiles(src, expected_columns, workers)
+
+    repair_row = partial(
+        _repair_parts,
+        expected_columns=expected_columns,
+        text_columns=text_columns,
+        other_columns=tuple(idx for idx in range(expected_columns) if idx not in text_columns),
+        stats=_scoring_stats(profiles, text_columns),
+    )
+
+    chunks = _chunk_ranges(src, workers)
+    with tempfile.TemporaryDirectory(dir=dst.parent) as draft_dir:
+        drafts = [str(Path(draft_dir) / f"{dst.name}.{n}") for n in range(len(chunks))]
+        if len(chunks) < 2:
+            results = [_repair_range(str(src), 0, chunks[0][1], header_parts, repair_row, drafts[0])]
+        else:
+            starts, ends = zip(*chunks)
+            with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+                results = list(
+                    pool.map(
+                        _repair_range,
+                        repeat(str(src)),
+                        starts,
+                        ends,
+                        repeat(header_parts),
+                        repeat(repair_row),
+                        drafts,
+                    )
+                )
+
+        pending: list[_Ambiguity] = []
+        lines_before = 0
+        for draft, result in enumerate(results):
+            for item in result.pending:
+                pending.append(item._replace(line_number=lines_before + item.line_number, draft=draft))
+            lines_before += result.lines
+
+        chosen = _resolve_ambiguities(pending, header_parts, choices)
+        if len(drafts) == 1 and not pending:
+            os.replace(drafts[0], dst)
+            return
+
+        patches: list[dict[int, str]] = [{} for _ in drafts]
+        for item, row in zip(pending, chosen):
+            patches[item.draft][item.row_index] = _csv_line(row)
+        _join_drafts(drafts, patches, dst)
+
+
+def _repair_range(
+    path: str,
+    start: int,
+    end: int,
+    header: list[str],
+    repair_row: _RowRepairer,
+    draft: str,
+) -> _RangeRepair:
+    """Repair the lines in the byte range [start, end) of `path` into the file `draft`.
+
+    Line numbers in the returned pending rows count from the start of the
+    range; the range holding the header also writes the header.
+    """
+    lines = _iter_range_lines(Path(path), start, end)
+    pending: list[_Ambiguity] = []
+    row_index = 0
+    # zip() stops on `lines` first, so `numbers` is left one past the last line read.
+    numbers = count(1)
 
-    if not lines:
-        dst.write_text("", encoding="utf-8", newline="")
-        return
+    with open(draft, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE) as out_fh:
+        if start == 0:
+            next(lines)
+            next(numbers)
+            out_fh.write(_csv_line(header))
+            row_index = 1
+
+        out_fh.writelines(_iter_repaired(zip(lines, numbers), len(header), repair_row, pending, row_index))
 
-    header_parts = _split_line(lines[0])
-    expected_columns = len(header_parts)
-    description_indices = _indices_of(header_parts, description_column)
-    profiles = _column_profiles(lines[1:], expected_columns)
+    return _RangeRepair(lines=next(numbers) - 1, pending=pending)
 
-    repaired_rows = [header_parts]
 
-    for line_number, line in enumerate(lines[1:], start=2):
+def _iter_repaired(
+    numbered_lines: Iterable[tuple[str, int]],
+    expected_columns: int,
+    repair_row: _RowRepairer,
+    pending: list[_Ambiguity],
+    row_index: int,
+) -> Iterator[str]:
+    """Yield each repaired body row as a CSV-encoded line.
+
+    Ambiguous rows yield their best-scoring repair as a placeholder and are
+    appended to `pending`, so each row is scored only once. `row_index` is the
+    output position of the first row yielded.
+    """
+    separators = expected_columns - 1
+    for line, line_number in numbered_lines:
         if not line:
             continue
 
-        parts = _split_line(line)
-        fixed = _repair_parts(
-            parts,
-            expected_columns,
-            description_indices,
-            profiles,
-            line_number,
-            line,
-            header_parts,
+        if line.count(",") == separators and '"' not in line:
+            yield line + "\r\n"
+        else:
+            parts = _split_line(line)
+            if len(parts) == expected_columns:
+                yield _csv_line(parts)
+            else:
+                fixed, ambiguous = repair_row(parts)
+                if ambiguous is not None:
+                    pending.append(_Ambiguity(line_number, line, ambiguous, row_index))
+                yield _csv_line(fixed)
+
+        row_index += 1
+
+
+def _join_drafts(drafts: Sequence[str], patches: Sequence[dict[int, str]], dst: Path) -> None:
+    """Concatenate `drafts` into `dst`, replacing the rows listed in each draft's `patches`."""
+    with dst.open("wb") as out_fh:
+        for draft, draft_patches in zip(drafts, patches):
+            if not draft_patches:
+                with open(draft, "rb") as in_fh:
+                    shutil.copyfileobj(in_fh, out_fh, _WRITE_BUFFER_SIZE)
+                continue
+
+            with open(draft, "r", encoding="utf-8", newline="", buffering=_READ_BUFFER_SIZE) as in_fh:
+                for row_index, line in enumerate(in_fh):
+                    out_fh.write(draft_patches.get(row_index, line).encode("utf-8"))
+
+
+def _csv_line(row: Sequence[str]) -> str:
+    """Encode `row` the way `csv.writer` would, skipping the csv module when no cell needs quoting.
+
+    Cells come from splitting on commas within a single line, so they never
+    hold line breaks; only merged commas and quote characters need quoting.
+    """
+    line = ",".join(row)
+    if line and '"' not in line and line.count(",") == len(row) - 1:
+        return line + "\r\n"
+
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(row)
+    return buffer.getvalue()
+
+
+def _resolve_ambiguities(
+    pending: Sequence[_Ambiguity],
+    header: Sequence[str],
+    choices: Sequence[int] | None,
+) -> list[list[str]]:
+    """Return the chosen repair for each pending row, in the same order."""
+    if choices is None:
+        return [
+            _ask_user_to_choose(
+                item.candidates, item.line_number, item.raw_line, header, position, len(pending)
+            )
+            for position, item in enumerate(pending, start=1)
+        ]
+
+    if len(choices) < len(pending):
+        raise AmbiguousRowError(
+            f"Ambiguous row at line {pending[len(choices)].line_number}. "
+            f"Provide a choice for each of the {len(pending)} ambiguous rows."
         )
-        repaired_rows.append(fixed)
 
-    with dst.open("w", encoding="utf-8", newline="") as out_fh:
-        writer = csv.writer(out_fh)
-        writer.writerows(repaired_rows)
+    if len(choices) > len(pending):
+        raise ValueError(f"Got {len(choices)} choices for {len(pending)} ambiguous rows")
+
+    chosen: list[list[str]] = []
+    for item, choice in zip(pending, choices):
+        max_options = min(4, len(item.candidates))
+        if not 1 <= choice <= max_options:
+            raise ValueError(
+                f"Choice {choice} for ambiguous row at line {item.line_number} "
+                f"must be between 1 and {max_options}"
+            )
+        chosen.append(item.candidates[choice - 1][1])
+
+    return chosen
+
+
+@contextmanager
+def _open_lines(path: Path) -> Iterator[Iterator[str]]:
+    """Yield a lazy iterator over the lines of `path` with line endings removed."""
+    with open(path, "r", encoding="utf-8", newline="", buffering=_READ_BUFFER_SIZE) as in_fh:
+        yield (line.rstrip("\r\n") for line in in_fh)
+
+
+def _has_overflow_rows(path: Path, expected_columns: int) -> bool:
+    """Return whether any line of `path` has more comma-separated fields than the header.
+
+    The file is memory-mapped and scanned as raw bytes, so it is never decoded
+    and lines are read straight from the page cache; a comma byte cannot occur
+    inside a multi-byte UTF-8 sequence. Lines are split on b"\n" only, which
+    can merge lines ending in a lone "\r" but never hides an overflowing row.
+    """
+    with open(path, "rb") as in_fh:
+        if os.fstat(in_fh.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(in_fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return any(line.count(b",") >= expected_columns for line in iter(mapped.readline, b""))
 
 
 def _split_line(line: str) -> list[str]:
@@ -82,125 +346,271 @@ def _indices_of(header: Sequence[str], column_name: str | Sequence[str]) -> list
     return indices
 
 
-def _column_profiles(lines: list[str], expected_columns: int) -> dict[int, dict[str, float]]:
-    totals: dict[int, int] = {}
-    counts: dict[int, int] = {}
-    numeric_counts: dict[int, int] = {}
-    non_empty_counts: dict[int, int] = {}
+def _file_column_profiles(path: Path, expected_columns: int, workers: int) -> _ColumnProfiles:
+    """Profile the body of `path`, splitting it across `workers` processes when more than one is requested."""
+    chunks = _chunk_ranges(path, workers)
+    if len(chunks) < 2:
+        with _open_lines(path) as lines:
+            next(lines)
+            return _column_profiles(lines, expected_columns)
+
+    starts, ends = zip(*chunks)
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        chunk_counts = list(
+            pool.map(_profile_chunk, repeat(str(path)), starts, ends, repeat(expected_columns))
+        )
+
+    return _profiles_from_counts(
+        _ProfileCounts(
+            rows=sum(counts.rows for counts in chunk_counts),
+            totals=_column_sums(counts.totals for counts in chunk_counts),
+            numeric_counts=_column_sums(counts.numeric_counts for counts in chunk_counts),
+            non_empty_counts=_column_sums(counts.non_empty_counts for counts in chunk_counts),
+        )
+    )
+
 
+def _column_sums(per_chunk: Iterable[list[int]]) -> list[int]:
+    return [sum(column) for column in zip(*per_chunk)]
+
+
+def _chunk_ranges(path: Path, workers: int) -> list[tuple[int, int]]:
+    """Split `path` into at most `workers` byte ranges that each start at a line boundary."""
+    size = path.stat().st_size
+    if workers < 2 or size == 0:
+        return [(0, size)]
+
+    starts = [0]
+    with open(path, "rb") as in_fh, mmap.mmap(in_fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        for k in range(1, workers):
+            newline = mapped.find(b"\n", k * size // workers)
+            if newline == -1:
+                break
+            if starts[-1] < newline + 1 < size:
+                starts.append(newline + 1)
+
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def _profile_chunk(path: str, start: int, end: int, expected_columns: int) -> _ProfileCounts:
+    lines = _iter_range_lines(Path(path), start, end)
+    if start == 0:
+        next(lines, None)
+
+    return _count_profile(lines, expected_columns)
+
+
+def _iter_range_lines(path: Path, start: int, end: int) -> Iterator[str]:
+    """Lazily yield the lines in the byte range [start, end) of `path` with line endings removed.
+
+    `start` must be a line boundary. Lines are split the way `_open_lines` splits
+    them, so a lone "\r" also ends a line.
+    """
+    if start == 0 and end >= path.stat().st_size:
+        with _open_lines(path) as lines:
+            yield from lines
+        return
+
+    with open(path, "rb", buffering=_READ_BUFFER_SIZE) as in_fh:
+        in_fh.seek(start)
+        position = start
+        for raw in in_fh:
+            if position >= end:
+                break
+            position += len(raw)
+
+            text = raw.decode("utf-8")
+            if text.endswith("\r\n"):
+                body = text[:-2]
+            elif text.endswith("\n"):
+                body = text[:-1]
+            else:
+                body = text
+            if "\r" in body:
+                yield from (line.rstrip("\r\n") for line in io.StringIO(text, newline=""))
+            else:
+                yield body
+
+
+def _column_profiles(lines: Iterable[str], expected_columns: int) -> _ColumnProfiles:
+    return _profiles_from_counts(_count_profile(lines, expected_columns))
+
+
+def _count_profile(lines: Iterable[str], expected_columns: int) -> _ProfileCounts:
+    counts = _ProfileCounts(
+        rows=0,
+        totals=[0] * expected_columns,
+        numeric_counts=[0] * expected_columns,
+        non_empty_counts=[0] * expected_columns,
+    )
+    rows = 0
+
+    separators = expected_columns - 1
+    batch: list[list[str]] = []
     for line in lines:
-        if not line:
-            continue
-        parts = _split_line(line)
-        if len(parts) != expected_columns:
+        if not line or line.count(",") != separators:
             continue
 
-        for idx, value in enumerate(parts):
-            totals[idx] = totals.get(idx, 0) + len(value)
-            counts[idx] = counts.get(idx, 0) + 1
-            non_empty_counts[idx] = non_empty_counts.get(idx, 0) + (1 if value != "" else 0)
-            numeric_counts[idx] = numeric_counts.get(idx, 0) + (1 if _is_number(value) else 0)
+        batch.append(_split_line(line))
+        if len(batch) >= _PROFILE_BATCH_SIZE:
+            rows += _accumulate_profile_batch(batch, counts)
+            batch = []
+
+    if batch:
+        rows += _accumulate_profile_batch(batch, counts)
+
+    return counts._replace(rows=rows)
+
 
-    profiles: dict[int, dict[str, float]] = {}
-    for idx, count in counts.items():
-        profiles[idx] = {
-            "mean_length": totals[idx] / count,
-            "numeric_ratio": numeric_counts[idx] / count,
-            "non_empty_ratio": non_empty_counts[idx] / count,
-        }
+def _profiles_from_counts(counts: _ProfileCounts) -> _ColumnProfiles:
+    if counts.rows == 0:
+        return _NO_PROFILES
 
-    return profiles
+    return _ColumnProfiles(
+        mean_length=tuple(total / counts.rows for total in counts.totals),
+        numeric_ratio=tuple(numeric / counts.rows for numeric in counts.numeric_counts),
+        non_empty_ratio=tuple(non_empty / counts.rows for non_empty in counts.non_empty_counts),
+    )
+
+
+def _accumulate_profile_batch(batch: list[list[str]], counts: _ProfileCounts) -> int:
+    """Add column-wise statistics for a batch of well-formed rows.
+
+    Rows are transposed so each column is reduced with builtin `sum`/`map`
+    calls instead of a Python-level update per cell.
+    """
+    for idx, column in enumerate(zip(*batch)):
+        counts.totals[idx] += sum(map(len, column))
+        counts.non_empty_counts[idx] += len(column) - column.count("")
+        counts.numeric_counts[idx] += sum(map(_is_number, column))
+
+    return len(batch)
+
+
+def _scoring_stats(profiles: _ColumnProfiles, text_columns: frozenset[int]) -> _ScoringStats:
+    columns = range(len(profiles.mean_length))
+
+    return _ScoringStats(
+        mean_lengths=profiles.mean_length,
+        length_weights=tuple(0.6 if idx in text_columns else 1.0 for idx in columns),
+        length_scales=tuple(mean_length + 1.0 for mean_length in profiles.mean_length),
+        numeric_columns=tuple(idx for idx in columns if profiles.numeric_ratio[idx] >= 0.8),
+        text_only_columns=tuple(idx for idx in columns if profiles.numeric_ratio[idx] <= 0.2),
+        required_columns=tuple(idx for idx in columns if profiles.non_empty_ratio[idx] >= 0.95),
+    )
 
 
 def _repair_parts(
     parts: list[str],
     expected_columns: int,
-    preferred_indices: Sequence[int],
-    profiles: dict[int, dict[str, float]],
-    line_number: int,
-    raw_line: str,
-    header: Sequence[str],
-) -> list[str]:
+    text_columns: frozenset[int],
+    other_columns: tuple[int, ...],
+    stats: _ScoringStats,
+) -> tuple[list[str], list[tuple[int, list[str], float]] | None]:
+    """Return the best repair for `parts` and, if the row is ambiguous, the options to choose from.
+
+    `repair` binds everything but `parts` once per file with `functools.partial`.
+    """
     if len(parts) == expected_columns:
-        return parts
+        return parts, None
 
     if len(parts) < expected_columns:
-        return parts + [""] * (expected_columns - len(parts))
+        return parts + [""] * (expected_columns - len(parts)), None
 
     candidates: list[tuple[int, list[str], float]] = []
-    for idx in range(expected_columns):
+    valid_indices: set[int] = set()
+    for idx in text_columns:
+        row = _repair_parts_at_index(parts, expected_columns, idx)
+        score, valid = _candidate_score(row, stats, text_columns, idx)
+        candidates.append((idx, row, score))
+        if valid:
+            valid_indices.add(idx)
+
+    # Every non-preferred candidate scores at least 0.5, so a single valid
+    # preferred candidate below this bound would win without a prompt anyway.
+    if len(valid_indices) == 1:
+        best = next(item for item in candidates if item[0] in valid_indices)
+        if best[2] < _CLEAR_WIN_SCORE:
+            return best[1], None
+
+    for idx in other_columns:
         row = _repair_parts_at_index(parts, expected_columns, idx)
-        score = _candidate_score(row, profiles, preferred_indices, idx)
+        score, valid = _candidate_score(row, stats, text_columns, idx)
         candidates.append((idx, row, score))
+        if valid:
+            valid_indices.add(idx)
 
-    candidates.sort(key=lambda item: item[2])
-    valid_candidates = [item for item in candidates if _is_candidate_valid(item[1], profiles)]
+    candidates.sort(key=lambda item: (item[2], item[0]))
+    valid_candidates = [item for item in candidates if item[0] in valid_indices]
 
     if len(valid_candidates) == 1:
-        return valid_candidates[0][1]
+        return valid_candidates[0][1], None
 
-    if len(valid_candidates) > 1 and _should_ask_user(valid_candidates, preferred_indices):
-        return _ask_user_to_choose(valid_candidates, line_number, raw_line, header)
+    if len(valid_candidates) > 1 and _should_ask_user(valid_candidates, text_columns):
+        return valid_candidates[0][1], valid_candidates
 
     if len(valid_candidates) > 1:
-        return valid_candidates[0][1]
+        return valid_candidates[0][1], None
 
     if len(candidates) == 1:
-        return candidates[0][1]
+        return candidates[0][1], None
 
     if _is_ambiguous(candidates):
-        return _ask_user_to_choose(candidates, line_number, raw_line, header)
+        return candidates[0][1], candidates
 
-    return candidates[0][1]
+    return candidates[0][1], None
 
 
 def _repair_parts_at_index(parts: list[str], expected_columns: int, description_index: int) -> list[str]:
     trailing_columns = expected_columns - description_index - 1
-    left = parts[:description_index]
+    row = parts[:description_index]
 
     if trailing_columns == 0:
-        description = ",".join(parts[description_index:])
-        return left + [description]
+        row.append(",".join(parts[description_index:]))
+        return row
 
-    right = parts[-trailing_columns:]
-    middle = parts[description_index : len(parts) - trailing_columns]
-    description = ",".join(middle)
-
-    return left + [description] + right
+    tail_start = len(parts) - trailing_columns
+    row.append(",".join(parts[description_index:tail_start]))
+    row.extend(parts[tail_start:])
+    return row
 
 
 def _candidate_score(
     row: Sequence[str],
-    profiles: dict[int, dict[str, float]],
-    preferred_indices: Sequence[int],
+    stats: _ScoringStats,
+    text_columns: frozenset[int],
     candidate_index: int,
-) -> float:
-    score = 0.0
-    text_columns = set(preferred_indices)
-
-    for idx, value in enumerate(row):
-        profile = profiles.get(idx)
-        if profile is None:
-            continue
-
-        mean_length = profile["mean_length"]
-        length_penalty = abs(len(value) - mean_length) / (mean_length + 1.0)
-        weight = 0.6 if idx in text_columns else 1.0
-        score += weight * length_penalty
+) -> tuple[float, bool]:
+    """Return the plausibility penalty of `row` and whether it meets the strong column constraints.
 
-        if profile["numeric_ratio"] >= 0.8 and not _is_number(value):
+    A row is invalid if a mostly numeric column holds a non-number or a
+    mostly filled column is empty; lower scores are more plausible.
+    """
+    score = 0.0
+    valid = True
+    for value, mean_length, weight, scale in zip(
+        row, stats.mean_lengths, stats.length_weights, stats.length_scales
+    ):
+        score += weight * (abs(len(value) - mean_length) / scale)
+
+    for idx in stats.numeric_columns:
+        if not _is_number(row[idx]):
             score += 5.0
+            valid = False
 
-        if profile["numeric_ratio"] <= 0.2 and _is_number(value):
+    for idx in stats.text_only_columns:
+        if _is_number(row[idx]):
             score += 2.5
 
-        if profile["non_empty_ratio"] >= 0.95 and value == "":
+    for idx in stats.required_columns:
+        if row[idx] == "":
             score += 2.0
+            valid = False
 
     if candidate_index not in text_columns:
         score += 0.5
 
-    return score
+    return score, valid
 
 
 def _is_ambiguous(candidates: Sequence[tuple[int, list[str], float]]) -> bool:
@@ -224,15 +634,14 @@ def _is_ambiguous(candidates: Sequence[tuple[int, list[str], float]]) -> bool:
 
 def _should_ask_user(
     valid_candidates: Sequence[tuple[int, list[str], float]],
-    preferred_indices: Sequence[int],
+    text_columns: frozenset[int],
 ) -> bool:
-    preferred = set(preferred_indices)
-    preferred_valid = [item for item in valid_candidates if item[0] in preferred]
+    preferred_valid = [item for item in valid_candidates if item[0] in text_columns]
     if len(preferred_valid) > 1:
         return True
 
     best_idx = valid_candidates[0][0]
-    if best_idx not in preferred and len(valid_candidates) > 1:
+    if best_idx not in text_columns and len(valid_candidates) > 1:
         return True
 
     if len(valid_candidates) > 1:
@@ -243,30 +652,17 @@ def _should_ask_user(
     return False
 
 
-def _is_candidate_valid(row: Sequence[str], profiles: dict[int, dict[str, float]]) -> bool:
-    for idx, value in enumerate(row):
-        profile = profiles.get(idx)
-        if profile is None:
-            continue
-
-        if profile["numeric_ratio"] >= 0.8 and not _is_number(value):
-            return False
-
-        if profile["non_empty_ratio"] >= 0.95 and value == "":
-            return False
-
-    return True
-
-
 def _ask_user_to_choose(
     candidates: Sequence[tuple[int, list[str], float]],
     line_number: int,
     raw_line: str,
     header: Sequence[str],
+    position: int,
+    total: int,
 ) -> list[str]:
     max_options = min(4, len(candidates))
     message_lines = [
-        f"Ambiguous CSV row at line {line_number}.",
+        f"Ambiguous CSV row at line {line_number} ({position} of {total}).",
         f"Raw row: {raw_line}",
         "Choose the correct repair:",
     ]
@@ -294,13 +690,12 @@ def _ask_user_to_choose(
         prompt = f"Invalid selection. Enter a number between 1 and {max_options}: "
 
 
+# The cache is bounded and per process. Within one row's candidates most cells
+# repeat, so scoring hits it often; any reuse of values classified while
+# profiling is incidental, and none when profiling ran in worker processes.
+@lru_cache(maxsize=4096)
 def _is_number(value: str) -> bool:
     if value == "":
         return False
 
-    cleaned = value.strip()
-    if re.fullmatch(r"[+-]?\d+(\.\d+)?", cleaned):
-        return True
-    if re.fullmatch(r"[+-]?\d{1,3}(,\d{3})+(\.\d+)?", cleaned):
-        return True
-    return False
+    return _NUMBER_RE.fullmatch(value.strip()) is not None
@@ -54,6 +54,18 @@ def test_repair_supports_multiple_text_columns(tmp_path: Path, monkeypatch: pyte
     assert _rows(output_file) == _rows(expected_file)
 
 
+def test_repair_profiles_in_parallel_workers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    input_file = FIXTURES / "corrupt_multi_text_columns.csv"
+    expected_file = FIXTURES / "corrupt_multi_text_columns.expected.csv"
+    output_file = tmp_path / "multiple-text-columns.parallel.repaired.csv"
+
+    monkeypatch.setattr("builtins.input", lambda _: "1")
+
+    csv_repair.repair(input_file, output_file, description_column=["DESCRIPTION", "NOTES"], workers=2)
+
+    assert _rows(output_file) == _rows(expected_file)
+
+
 def test_repair_raises_when_description_column_missing(tmp_path: Path) -> None:
     input_file = FIXTURES / "clean.csv"
     output_file = tmp_path / "missing-column.csv"
@@ -89,6 +101,71 @@ def test_repair_raises_ambiguous_error_when_user_input_unavailable(
         csv_repair.repair(input_file, output_file, description_column=["INVOICE", "DESCRIPTION"])
 
 
+def test_repair_uses_choices_without_prompting(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    input_file = FIXTURES / "ambiguous_invoice.csv"
+    expected_file = FIXTURES / "ambiguous_invoice.choice1.expected.csv"
+    output_file = tmp_path / "ambiguous.choices.repaired.csv"
+
+    def _fail(_: str) -> str:
+        raise AssertionError("input() should not be called when choices are given")
+
+    monkeypatch.setattr("builtins.input", _fail)
+
+    csv_repair.repair(
+        input_file,
+        output_file,
+        description_column=["INVOICE", "DESCRIPTION"],
+        choices=[1],
+    )
+
+    assert _rows(output_file) == _rows(expected_file)
+
+
+def test_repair_raises_ambiguous_error_when_choices_run_out(tmp_path: Path) -> None:
+    input_file = FIXTURES / "ambiguous_invoice.csv"
+    output_file = tmp_path / "ambiguous.nochoices.repaired.csv"
+
+    with pytest.raises(csv_repair.AmbiguousRowError, match="Ambiguous row at line 2"):
+        csv_repair.repair(
+            input_file,
+            output_file,
+            description_column=["INVOICE", "DESCRIPTION"],
+            choices=[],
+        )
+
+    assert not output_file.exists()
+
+
+def test_repair_raises_when_choice_out_of_range(tmp_path: Path) -> None:
+    input_file = FIXTURES / "ambiguous_invoice.csv"
+    output_file = tmp_path / "ambiguous.badchoice.repaired.csv"
+
+    with pytest.raises(ValueError, match="Choice 9 for ambiguous row at line 2"):
+        csv_repair.repair(
+            input_file,
+            output_file,
+            description_column=["INVOICE", "DESCRIPTION"],
+            choices=[9],
+        )
+
+    assert not output_file.exists()
+
+
+def test_repair_raises_when_more_choices_than_ambiguous_rows(tmp_path: Path) -> None:
+    input_file = FIXTURES / "ambiguous_invoice.csv"
+    output_file = tmp_path / "ambiguous.extrachoices.repaired.csv"
+
+    with pytest.raises(ValueError, match="Got 2 choices for 1 ambiguous rows"):
+        csv_repair.repair(
+            input_file,
+            output_file,
+            description_column=["INVOICE", "DESCRIPTION"],
+            choices=[1, 1],
+        )
+
+    assert not output_file.exists()
+
+
 def test_repair_handles_invoice_with_unenclosed_comma_prefix(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None: